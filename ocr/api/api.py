@@ -2,28 +2,67 @@ import json
 import re
 import frappe
 from google.cloud import vision
+from frappe.utils import cint
 from frappe.utils.file_manager import get_file_path
+from ocr.api.profiling import profile_request
+from ocr.api.tiling import DEFAULT_OVERLAP, DEFAULT_TILE_HEIGHT, ocr_document
+
+def get_vision_text(file_path):
+    # Initialize Google Vision client
+    google_credentials = json.loads(frappe.conf.get("google_application_credentials"))
+    client = vision.ImageAnnotatorClient.from_service_account_info(google_credentials)
+
+    # Read the image
+    with open(file_path, "rb") as image_file:
+        content = image_file.read()
+    image = vision.Image(content=content)
+
+    # Perform OCR
+    response = client.text_detection(image=image)
+    texts = response.text_annotations
+    return texts[0].description if texts else ""
+
+
+def get_local_text(file_path):
+    # Tiled tesseract OCR, recognised in parallel
+    tile_height = max(cint(frappe.conf.get("ocr_tile_height")) or DEFAULT_TILE_HEIGHT, 1)
+
+    # Only fall back to the default when unset; 0 is allowed but splits lines
+    # crossing a hard cut in two (see README)
+    overlap = frappe.conf.get("ocr_tile_overlap")
+    overlap = DEFAULT_OVERLAP if overlap is None else cint(overlap)
+    # Keep every tile moving forward by at least half its height
+    overlap = min(max(overlap, 0), tile_height // 2)
+
+    return ocr_document(
+        file_path,
+        tile_height=tile_height,
+        overlap=overlap,
+        max_workers=max(cint(frappe.conf.get("ocr_tile_workers")), 0) or None,
+    )
+
 
 @frappe.whitelist()
+@profile_request
 def extract_document_data(docname, file_url):
     try:
         file_path = get_file_path(file_url)
-        # Initialize Google Vision client
-        google_credentials = json.loads(frappe.conf.get("google_application_credentials"))
-        client = vision.ImageAnnotatorClient.from_service_account_info(google_credentials)
-        
-        # Read the image
-        with open(file_path, "rb") as image_file:
-            content = image_file.read()
-        image = vision.Image(content=content)
-        
-        # Perform OCR
-        response = client.text_detection(image=image)
-        texts = response.text_annotations
-        if not texts:
+
+        # "vision" (default), "local" or "auto" (Vision, falling back to local OCR)
+        engine = frappe.conf.get("ocr_document_engine") or "vision"
+        if engine == "local":
+            extracted_text = get_local_text(file_path)
+        else:
+            try:
+                extracted_text = get_vision_text(file_path)
+            except Exception as e:
+                if engine != "auto":
+                    raise
+                frappe.log_error(f"Vision OCR Error: {str(e)}\nFalling back to local OCR", "Document OCR Fallback")
+                extracted_text = get_local_text(file_path)
+
+        if not extracted_text.strip():
             return {"success": False, "error": "No text detected."}
-            
-        extracted_text = texts[0].description
         
         # Get the Purchase Receipt document
         doc = frappe.get_doc("Purchase Receipt", docname)
@@ -1,10 +1,12 @@
 import pytesseract
-import re
 import frappe
 from frappe.utils.file_manager import get_file_path
+from ocr.api.fields import LINE_EXTRACTOR, extract_fields, get_missing_fields
+from ocr.api.profiling import profile_request
 from PIL import Image, ImageEnhance, ImageFilter
 
 @frappe.whitelist()
+@profile_request
 def extract_item_level_data(docname, item_idx):
     try:
         # Basic setup
@@ -65,47 +67,15 @@ def extract_item_level_data(docname, item_idx):
         # Store raw text for logging
         raw_text = extracted_text
 
-        # Initialize variables
-        lot_no = None
-        reel_no = None
-        weight = None
-        missing_fields = []
-
-        # Extract Lot No.
-        lot_pattern = r"Lot\s*No\.\s*:\s*(\d{6,7})"
-        lot_match = re.search(lot_pattern, extracted_text, re.IGNORECASE)
-        if lot_match:
-            lot_no = lot_match.group(1).strip()
-
-        # Extract Reel No.
-        reel_pattern = r"REEL\s*No\.\s*:\s*(\d{3}\s*\d{5})"
-        reel_match = re.search(reel_pattern, extracted_text, re.IGNORECASE)
-        if reel_match:
-            reel_no = reel_match.group(1).replace(" ", "").strip()
-
-        # Simplified weight extraction
-        # First split text into lines
-        lines = extracted_text.split('\n')
-        for line in lines:
-            # Look for line containing weight information
-            if 'Wt' in line or 'KGS' in line.upper():
-                # Extract the number from this line
-                numbers = re.findall(r'\d+', line)
-                if numbers:
-                    # Take the last number in the line as weight
-                    potential_weight = numbers[-1]
-                    # Verify it's not the lot number or reel number
-                    if potential_weight != lot_no and (not reel_no or potential_weight not in reel_no):
-                        weight = potential_weight
-                        break
+        # Extract Lot No., Reel No. and Weight in a single pass
+        # Weight is the last number on a "Wt" / "KGS" line, excluding the lot and reel numbers
+        fields = extract_fields(extracted_text, LINE_EXTRACTOR)
+        lot_no = fields["lot_no"]["value"] if "lot_no" in fields else None
+        reel_no = fields["reel_no"]["value"] if "reel_no" in fields else None
+        weight = fields["weight"]["value"] if "weight" in fields else None
 
         # Track missing fields
-        if not lot_no:
-            missing_fields.append("Lot No")
-        if not reel_no:
-            missing_fields.append("Reel No")
-        if not weight:
-            missing_fields.append("Weight")
+        missing_fields = get_missing_fields(fields)
 
         # Update document fields
         if lot_no:
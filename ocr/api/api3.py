@@ -1,10 +1,12 @@
 import pytesseract
-import re
 import frappe
 from frappe.utils.file_manager import get_file_path
+from ocr.api.fields import LABEL_EXTRACTOR, extract_fields
+from ocr.api.profiling import profile_request
 from PIL import Image, ImageEnhance, ImageFilter
 
 @frappe.whitelist()
+@profile_request
 def extract_item_level_data(docname, item_idx):
     try:
         # Fetch the Purchase Receipt document
@@ -36,20 +38,11 @@ def extract_item_level_data(docname, item_idx):
         # Store raw text for logging
         raw_text = extracted_text
 
-        # 🔹 Extract Lot No.
-        lot_pattern = r"Lot\s*No\.\s*:\s*(\d{6,7})"
-        lot_match = re.search(lot_pattern, extracted_text, re.IGNORECASE)
-        lot_no = lot_match.group(1).strip() if lot_match else None
-
-        # 🔹 Extract Reel No.
-        reel_pattern = r"REEL\s*No\.\s*:\s*(\d{3}\s*\d{5})"
-        reel_match = re.search(reel_pattern, extracted_text, re.IGNORECASE)
-        reel_no = reel_match.group(1).replace(" ", "").strip() if reel_match else None
-
-        # 🔹 Extract Weight (Only keeping direct pattern match)
-        weight_pattern = r"Wt\s*\(In\s*Kgs\)\s*:\s*(\d{2,3})"
-        weight_match = re.search(weight_pattern, extracted_text, re.IGNORECASE)
-        weight = weight_match.group(1).strip() if weight_match else None
+        # 🔹 Extract Lot No., Reel No. and Weight (direct label matches only)
+        fields = extract_fields(extracted_text, LABEL_EXTRACTOR)
+        lot_no = fields["lot_no"]["value"] if "lot_no" in fields else None
+        reel_no = fields["reel_no"]["value"] if "reel_no" in fields else None
+        weight = fields["weight"]["value"] if "weight" in fields else None
 
         # Update document fields
         if lot_no:
@@ -2,9 +2,12 @@ import pytesseract
 import re
 import frappe
 from frappe.utils.file_manager import get_file_path
+from ocr.api.fields import LABEL_EXTRACTOR, SPARSE_EXTRACTOR, extract_fields
+from ocr.api.profiling import profile_request
 from PIL import Image, ImageEnhance, ImageFilter
 
 @frappe.whitelist()
+@profile_request
 def extract_item_level_data(docname, item_idx):
     try:
         # Fetch the Purchase Receipt document
@@ -40,17 +43,10 @@ def extract_item_level_data(docname, item_idx):
         full_text = pytesseract.image_to_string(img, config=custom_config)
         frappe.logger().debug(f"OCR Full Text Output: {full_text}")
 
-        if not lot_no:
-            match = re.search(r'Lot\s*No\.\s*:\s*(\d{6,7})', full_text, re.IGNORECASE)
-            lot_no = match.group(1) if match else None
-        
-        if not reel_no:
-            match = re.search(r'REEL\s*No\.\s*:\s*(\d{3}\s*\d{5})', full_text, re.IGNORECASE)
-            reel_no = match.group(1) if match else None
-        
-        if not weight:
-            match = re.search(r'Wt\s*\(In\s*Kgs\)\s*:\s*(\d{2,3})', full_text, re.IGNORECASE)
-            weight = match.group(1) if match else None
+        fields = extract_fields(full_text, LABEL_EXTRACTOR)
+        lot_no = fields["lot_no"]["value"] if "lot_no" in fields else None
+        reel_no = fields["reel_no"]["value"] if "reel_no" in fields else None
+        weight = fields["weight"]["value"] if "weight" in fields else None
 
         ###  **2. If Any Field is Missing, Use `image_to_data()` (Word-Based OCR)**
         if not lot_no or not reel_no or not weight:
@@ -74,17 +70,15 @@ def extract_item_level_data(docname, item_idx):
             alt_text = pytesseract.image_to_string(img, config=alternative_config)
             frappe.logger().debug(f"Alternative OCR Output: {alt_text}")
 
-            if not lot_no:
-                match = re.search(r'Lot\s*No[:\-]?\s*(\d+)', alt_text, re.IGNORECASE)
-                lot_no = match.group(1) if match else lot_no
+            alt_fields = extract_fields(alt_text, SPARSE_EXTRACTOR)
+            if not lot_no and "lot_no" in alt_fields:
+                lot_no = alt_fields["lot_no"]["value"]
 
-            if not reel_no:
-                match = re.search(r'REEL\s*No[:\-]?\s*(\d+)', alt_text, re.IGNORECASE)
-                reel_no = match.group(1) if match else reel_no
+            if not reel_no and "reel_no" in alt_fields:
+                reel_no = alt_fields["reel_no"]["value"]
 
-            if not weight:
-                match = re.search(r'(\d+(\.\d+)?)\s*Kgs', alt_text, re.IGNORECASE)
-                weight = match.group(1) if match else weight
+            if not weight and "weight" in alt_fields:
+                weight = alt_fields["weight"]["value"]
 
         ### 🔹 **Final Validations & Document Update**
         if lot_no:
@@ -0,0 +1,181 @@
+import re
+import time
+
+# Declarative field registry shared by the item-level extractors.
+#
+# Each field lists its accepted formats in priority order. A format is tagged
+# so an extractor can pick the formats that suit its OCR output:
+#   "label"  - strict "Label No. : value" text from a clean full-text pass
+#   "line"   - last number on a line mentioning the field (noisy OCR)
+#   "sparse" - loose patterns for Tesseract's sparse text mode (--psm 11)
+#
+# Every pattern must capture the value in its first group. All patterns are
+# compiled once at import into a single regex in which each format is its own
+# lookahead, so one pass over the text tries every format at every position
+# and matches of different fields or formats may overlap, as if each pattern
+# were searched on its own. Adding a field or a format only means adding an
+# entry here.
+
+FIELD_SPECS = [
+    {
+        "fieldname": "lot_no",
+        "label": "Lot No",
+        "formats": [
+            {"tag": "label", "pattern": r"Lot\s*No\.\s*:\s*(\d{6,7})"},
+            {"tag": "sparse", "pattern": r"Lot\s*No[:\-]?\s*(\d+)"},
+        ],
+        "validate": r"\d+",
+    },
+    {
+        "fieldname": "reel_no",
+        "label": "Reel No",
+        "formats": [
+            {"tag": "label", "pattern": r"REEL\s*No\.\s*:\s*(\d{3}\s*\d{5})"},
+            {"tag": "sparse", "pattern": r"REEL\s*No[:\-]?\s*(\d+)"},
+        ],
+        "strip_whitespace": True,
+        "validate": r"\d+",
+    },
+    {
+        "fieldname": "weight",
+        "label": "Weight",
+        "formats": [
+            {"tag": "label", "pattern": r"Wt\s*\(In\s*Kgs\)\s*:\s*(\d{2,3})"},
+            # Last number on a line mentioning "Wt" or "KGS"
+            {
+                "tag": "line",
+                "pattern": r"^(?=[^\n]*(?:(?-i:Wt)|KGS))[^\n]*?(\d+)[^\d\n]*$",
+                # Noisy lines often repeat the lot or reel number
+                "exclude_equal": ["lot_no"],
+                "exclude_within": ["reel_no"],
+            },
+            {"tag": "sparse", "pattern": r"(\d+(?:\.\d+)?)\s*Kgs"},
+        ],
+        "validate": r"\d+(?:\.\d+)?",
+    },
+]
+
+FLAGS = re.IGNORECASE | re.MULTILINE
+
+
+def compile_fields(tags, overrides=None, specs=FIELD_SPECS):
+    # overrides maps a fieldname to the tags used for that field instead of `tags`
+    # Returns (regex, [(group name, spec, priority, fmt, value group)], specs)
+    formats = []
+    for spec in specs:
+        field_tags = (overrides or {}).get(spec["fieldname"], tags)
+        field_formats = [f for f in spec["formats"] if f["tag"] in field_tags]
+        field_formats.sort(key=lambda f: field_tags.index(f["tag"]))
+        formats.extend((spec, priority, fmt) for priority, fmt in enumerate(field_formats))
+
+    # The gate lets the regex engine skip positions where no format matches
+    gate = "(?=" + "|".join("(?:{0})".format(fmt["pattern"]) for _, _, fmt in formats) + ")"
+    parts = [gate]
+    index = []
+    group = re.compile(gate).groups
+    for spec, priority, fmt in formats:
+        name = "f{0}".format(len(index))
+        # Optional lookahead: zero width, so every format is tried at every position
+        parts.append("(?:(?=(?P<{0}>{1})))?".format(name, fmt["pattern"]))
+        # Outer named group comes first, the value is the pattern's first group
+        index.append((name, spec, priority, fmt, group + 2))
+        group += 1 + re.compile(fmt["pattern"]).groups
+
+    # Fields with exclusions are resolved last so they can be checked against the others
+    ordered = sorted(specs, key=lambda s: any(
+        f.get("exclude_equal") or f.get("exclude_within") for f in s["formats"]
+    ))
+    return re.compile("".join(parts), FLAGS), index, ordered
+
+
+def _is_valid(spec, fmt, value, found):
+    if spec.get("validate") and not re.fullmatch(spec["validate"], value):
+        return False
+    for other in fmt.get("exclude_equal", []):
+        if other in found and value == found[other]["value"]:
+            return False
+    for other in fmt.get("exclude_within", []):
+        if other in found and value in found[other]["value"]:
+            return False
+    return True
+
+
+def extract_fields(text, extractor):
+    # Single pass over the text; returns {fieldname: {value, start, end, tag}}
+    regex, index, specs = extractor
+    candidates = {}
+    # Matches of one format do not overlap, like consecutive re.search calls
+    format_end = {}
+    for match in regex.finditer(text or ""):
+        for name, spec, priority, fmt, value_group in index:
+            start = match.start(name)
+            if start == -1 or start < format_end.get(name, 0):
+                continue
+            format_end[name] = max(match.end(name), start + 1)
+
+            value = match.group(value_group)
+            if value is None:
+                continue
+            if spec.get("strip_whitespace"):
+                value = re.sub(r"\s+", "", value)
+            else:
+                value = value.strip()
+
+            candidates.setdefault(spec["fieldname"], []).append((priority, match.start(value_group), fmt, {
+                "value": value,
+                "start": match.start(value_group),
+                "end": match.end(value_group),
+                "tag": fmt["tag"],
+            }))
+
+    found = {}
+    for spec in specs:
+        # Best format first, then earliest position in the text
+        for _, _, fmt, candidate in sorted(candidates.get(spec["fieldname"], []), key=lambda c: c[:2]):
+            if _is_valid(spec, fmt, candidate["value"], found):
+                found[spec["fieldname"]] = candidate
+                break
+
+    return found
+
+
+def get_missing_fields(found, specs=FIELD_SPECS):
+    return [spec["label"] for spec in specs if spec["fieldname"] not in found]
+
+
+# Extractors used by the API modules, compiled once at import
+LABEL_EXTRACTOR = compile_fields(("label",))
+# api2 reads the weight only from its line rule, never the "Wt (In Kgs)" label
+LINE_EXTRACTOR = compile_fields(("label",), overrides={"weight": ("line",)})
+SPARSE_EXTRACTOR = compile_fields(("sparse",))
+
+
+SAMPLE_TEXT = """CREPE TISSUE PAPER
+Lot No. : 240517
+REEL No. : 123 45678
+Size : 90 CM   GSM : 18
+Wt (In Kgs) : 152
+Net Wt 152 KGS
+"""
+
+
+def benchmark(iterations=10000):
+    # Per-call parsing cost, e.g. `bench execute ocr.api.fields.benchmark`
+    results = {}
+    for name, extractor in (
+        ("label", LABEL_EXTRACTOR),
+        ("line", LINE_EXTRACTOR),
+        ("sparse", SPARSE_EXTRACTOR),
+    ):
+        start = time.perf_counter()
+        for _ in range(iterations):
+            extract_fields(SAMPLE_TEXT, extractor)
+        results[name] = (time.perf_counter() - start) / iterations * 1e6
+
+    for name, micros in results.items():
+        print(f"{name:<8} {micros:8.2f} us/call")
+    return results
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -0,0 +1,130 @@
+import cProfile
+import functools
+import io
+import pstats
+import random
+import time
+
+import frappe
+from frappe.utils import flt
+
+# Opt-in profiling for the OCR whitelisted methods.
+#
+# Enabled from site_config.json:
+#   "ocr_profiling_enabled": 1,
+#   "ocr_profiling_threshold": 5,      # seconds, capture requests slower than this
+#   "ocr_profiling_sample_rate": 0.01  # also capture this fraction of all requests
+#
+# pyinstrument (sampling profiler) is used when installed, cProfile otherwise.
+# Captured profiles are attached as a private File to an Error Log.
+
+DEFAULT_THRESHOLD = 5.0
+
+
+def _get_settings():
+    conf = frappe.conf
+    if not conf.get("ocr_profiling_enabled"):
+        return None
+
+    # flt() turns mistyped values into 0 instead of raising on every OCR call,
+    # an unset or unreadable threshold falls back to the default
+    return {
+        "threshold": flt(conf.get("ocr_profiling_threshold")) or DEFAULT_THRESHOLD,
+        "sample_rate": flt(conf.get("ocr_profiling_sample_rate")),
+    }
+
+
+def _start_profiler():
+    try:
+        from pyinstrument import Profiler
+    except ImportError:
+        profiler = cProfile.Profile()
+        profiler.enable()
+        return "cprofile", profiler
+
+    profiler = Profiler()
+    profiler.start()
+    return "pyinstrument", profiler
+
+
+def _stop_profiler(kind, profiler):
+    if kind == "pyinstrument":
+        profiler.stop()
+    else:
+        profiler.disable()
+
+
+def _render_profile(kind, profiler):
+    # Returns (file extension, content) for the captured profile
+    if kind == "pyinstrument":
+        return "html", profiler.output_html()
+
+    stream = io.StringIO()
+    stats = pstats.Stats(profiler, stream=stream)
+    stats.sort_stats("cumulative").print_stats(50)
+    return "txt", stream.getvalue()
+
+
+def _save_profile(method, elapsed, reason, extension, content):
+    title = "OCR Profile: {0}".format(method)
+    error_log = frappe.log_error(
+        f"{method} took {elapsed:.3f}s ({reason})\nProfile attached as {extension} file.",
+        title,
+    )
+
+    file_name = "ocr-profile-{0}-{1}.{2}".format(
+        method.rsplit(".", 1)[-1], frappe.generate_hash(length=8), extension
+    )
+    frappe.get_doc({
+        "doctype": "File",
+        "file_name": file_name,
+        "attached_to_doctype": "Error Log",
+        "attached_to_name": error_log.name,
+        "content": content,
+        "is_private": 1,
+    }).insert(ignore_permissions=True)
+
+
+def profile_request(fn):
+    method = "{0}.{1}".format(fn.__module__, fn.__name__)
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        try:
+            settings = _get_settings()
+        except Exception:
+            settings = None
+        if not settings:
+            return fn(*args, **kwargs)
+
+        sampled = random.random() < settings["sample_rate"]
+        try:
+            kind, profiler = _start_profiler()
+        except Exception:
+            # Another profiler is already active in this process
+            # (cProfile raises ValueError, pyinstrument RuntimeError)
+            return fn(*args, **kwargs)
+
+        start = time.perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            # Never let profiling break the OCR request itself
+            try:
+                _stop_profiler(kind, profiler)
+
+                reason = None
+                if elapsed >= settings["threshold"]:
+                    reason = "exceeded {0}s threshold".format(settings["threshold"])
+                elif sampled:
+                    reason = "randomly sampled"
+
+                # Only render the profile for requests that are actually saved
+                if reason:
+                    extension, content = _render_profile(kind, profiler)
+                    _save_profile(method, elapsed, reason, extension, content)
+            except Exception:
+                frappe.logger().exception(f"Could not save OCR profile for {method}")
+
+    return wrapper
@@ -0,0 +1,120 @@
+import re
+import unittest
+
+from ocr.api.fields import (
+    LABEL_EXTRACTOR,
+    LINE_EXTRACTOR,
+    SAMPLE_TEXT,
+    SPARSE_EXTRACTOR,
+    compile_fields,
+    extract_fields,
+)
+
+# Per-field re.search rules the extractors replaced, kept as the reference
+
+
+def _search(pattern, text):
+    match = re.search(pattern, text, re.IGNORECASE)
+    return match.group(1) if match else None
+
+
+def label_reference(text):
+    # api3, and api4's first pass
+    reel_no = _search(r"REEL\s*No\.\s*:\s*(\d{3}\s*\d{5})", text)
+    return {
+        "lot_no": _search(r"Lot\s*No\.\s*:\s*(\d{6,7})", text),
+        "reel_no": re.sub(r"\s+", "", reel_no) if reel_no else None,
+        "weight": _search(r"Wt\s*\(In\s*Kgs\)\s*:\s*(\d{2,3})", text),
+    }
+
+
+def sparse_reference(text):
+    # api4's --psm 11 pass
+    return {
+        "lot_no": _search(r"Lot\s*No[:\-]?\s*(\d+)", text),
+        "reel_no": _search(r"REEL\s*No[:\-]?\s*(\d+)", text),
+        "weight": _search(r"(\d+(\.\d+)?)\s*Kgs", text),
+    }
+
+
+def line_reference(text):
+    # api2: label lot / reel, weight is the last number on a "Wt" / "KGS" line
+    values = label_reference(text)
+    lot_no, reel_no = values["lot_no"], values["reel_no"]
+    values["weight"] = None
+    for line in text.split("\n"):
+        if "Wt" in line or "KGS" in line.upper():
+            numbers = re.findall(r"\d+", line)
+            if numbers and numbers[-1] != lot_no and (not reel_no or numbers[-1] not in reel_no):
+                values["weight"] = numbers[-1]
+                break
+    return values
+
+
+def values(text, extractor):
+    found = extract_fields(text, extractor)
+    return {
+        fieldname: found[fieldname]["value"] if fieldname in found else None
+        for fieldname in ("lot_no", "reel_no", "weight")
+    }
+
+
+TEXTS = [
+    SAMPLE_TEXT,
+    "",
+    "Lot No\n\n240517\n\nREEL No\n\n152.5 Kgs",
+    "REEL No:\n\n152 Kgs",
+    "WT (IN KGS) : 1050",
+    "Lot No.: 240517\nNET WT 40 KGS",
+    "REEL No.: 123 45152\nWt (In Kgs) : 152",
+    "Lot No. : 240517 Wt 152",
+    "Lot No.: 240517\nNet Wt 152 KGS 240517\nGross Wt: 160 KGS",
+    "REEL No.: 123 45678\nwt 45678\nWt 12",
+    "Lot No-1050 Kgs\nREEL No 7 Kgs",
+    "Wt (In Kgs) : 12 Lot No. : 1234567 REEL No. : 12345678",
+]
+
+
+class TestFieldExtraction(unittest.TestCase):
+    def test_label_matches_reference(self):
+        for text in TEXTS:
+            with self.subTest(text=text):
+                self.assertEqual(values(text, LABEL_EXTRACTOR), label_reference(text))
+
+    def test_sparse_matches_reference(self):
+        for text in TEXTS:
+            with self.subTest(text=text):
+                self.assertEqual(values(text, SPARSE_EXTRACTOR), sparse_reference(text))
+
+    def test_line_matches_reference(self):
+        for text in TEXTS:
+            with self.subTest(text=text):
+                self.assertEqual(values(text, LINE_EXTRACTOR), line_reference(text))
+
+    def test_fields_do_not_consume_each_other(self):
+        text = "Lot No\n\n240517\n\nREEL No\n\n152.5 Kgs"
+        self.assertEqual(values(text, SPARSE_EXTRACTOR)["weight"], "152.5")
+
+    def test_positions(self):
+        text = "Lot No. : 240517"
+        found = extract_fields(text, LABEL_EXTRACTOR)["lot_no"]
+        self.assertEqual(text[found["start"]:found["end"]], "240517")
+        self.assertEqual(found["tag"], "label")
+
+    def test_lower_priority_format_at_same_position(self):
+        specs = [
+            {
+                "fieldname": "code",
+                "label": "Code",
+                "formats": [
+                    {"tag": "strict", "pattern": r"Code\s*:\s*(\w+)"},
+                    {"tag": "loose", "pattern": r"Code\s*:\s*(\w{2})"},
+                ],
+                "validate": r"\d+",
+            },
+        ]
+        extractor = compile_fields(("strict", "loose"), specs=specs)
+        # "12AB" fails validation, the loose format at the same position still applies
+        found = extract_fields("Code: 12AB", extractor)
+        self.assertEqual(found["code"]["value"], "12")
+        self.assertEqual(found["code"]["tag"], "loose")
@@ -0,0 +1,113 @@
+import unittest
+
+from PIL import Image, ImageDraw
+
+from ocr.api.tiling import _stitch, find_tiles
+
+
+def _page(height, line_pitch=40, rules=False):
+    # White page with a black text-like bar every line_pitch pixels
+    img = Image.new("L", (800, height), 255)
+    draw = ImageDraw.Draw(img)
+    for y in range(0, height, line_pitch):
+        draw.rectangle((20, y + 5, 700, y + 25), fill=0)
+    if rules:
+        # Table borders running the full height of the page
+        draw.line((5, 0, 5, height), fill=0, width=3)
+        draw.line((780, 0, 780, height), fill=0, width=3)
+    return img
+
+
+class TestFindTiles(unittest.TestCase):
+    def test_small_page_is_one_tile(self):
+        self.assertEqual(find_tiles(_page(800), 1200, 100), [(0, 800)])
+
+    def test_cuts_in_whitespace_gaps(self):
+        tiles = find_tiles(_page(3000), 1200, 100)
+        self.assertEqual(tiles[0][0], 0)
+        self.assertEqual(tiles[-1][1], 3000)
+        for (_, bottom), (top, _) in zip(tiles, tiles[1:]):
+            # No overlap, and the cut is not inside a text bar (rows 5-25 of every 40)
+            self.assertEqual(bottom, top)
+            self.assertFalse(5 <= bottom % 40 <= 25)
+
+    def test_cuts_in_gaps_between_table_rules(self):
+        tiles = find_tiles(_page(3000, rules=True), 1200, 100)
+        for (_, bottom), (top, _) in zip(tiles, tiles[1:]):
+            self.assertEqual(bottom, top)
+            self.assertFalse(5 <= bottom % 40 <= 25)
+
+    def test_hard_cut_overlaps(self):
+        # All ink, no gap anywhere
+        tiles = find_tiles(Image.new("L", (800, 3000), 0), 1200, 100)
+        self.assertEqual(tiles, [(0, 1200), (1100, 2300), (2200, 3000)])
+
+    def test_blank_page(self):
+        tiles = find_tiles(Image.new("L", (800, 3000), 255), 1200, 100)
+        self.assertEqual(tiles[0][0], 0)
+        self.assertEqual(tiles[-1][1], 3000)
+        for (_, bottom), (top, _) in zip(tiles, tiles[1:]):
+            self.assertEqual(bottom, top)
+
+    def test_invalid_overlap(self):
+        img = _page(3000)
+        for tile_height, overlap in ((50, 50), (50, 60), (50, -1), (0, 0)):
+            with self.subTest(tile_height=tile_height, overlap=overlap):
+                with self.assertRaises(ValueError):
+                    find_tiles(img, tile_height, overlap)
+
+
+class TestStitch(unittest.TestCase):
+    tiles = [(0, 1200), (1100, 2000)]
+
+    def test_line_crossing_hard_cut_kept_once(self):
+        tile_lines = [
+            [
+                (1000, 1040, "111111 1 11111111 100"),
+                (1080, 1120, "222222 1 22222222 200"),
+                (1130, 1170, "333333 1 33333333 300"),
+                # Partial copy of the line crossing the cut at 1200
+                (1180, 1200, "444444 1 4444"),
+            ],
+            [
+                # Partial copy of the line crossing the tile top at 1100
+                (1100, 1120, "2222 200"),
+                (1130, 1170, "333333 1 33333333 300"),
+                (1180, 1220, "444444 1 44444444 400"),
+                (1300, 1340, "555555 1 55555555 500"),
+            ],
+        ]
+        self.assertEqual(_stitch(tile_lines, self.tiles).split("\n"), [
+            "111111 1 11111111 100",
+            "222222 1 22222222 200",
+            "333333 1 33333333 300",
+            "444444 1 44444444 400",
+            "555555 1 55555555 500",
+        ])
+
+    def test_centre_on_split_goes_to_later_tile(self):
+        # The split is at 1150; a line centred exactly there is kept once
+        tile_lines = [
+            [(1130, 1170, "333333 1 33333333 300")],
+            [(1130, 1170, "333333 1 33333333 300")],
+        ]
+        self.assertEqual(_stitch(tile_lines, self.tiles), "333333 1 33333333 300")
+
+    def test_boxes_differing_around_split_kept_once(self):
+        # Each tile boxes the line slightly differently, one copy on either side
+        tile_lines = [
+            [(1129, 1169, "333333 1 33333333 300")],
+            [(1131, 1171, "333333  1 33333333 300")],
+        ]
+        self.assertEqual(_stitch(tile_lines, self.tiles), "333333 1 33333333 300")
+
+    def test_gap_cut_keeps_all_lines(self):
+        tiles = [(0, 1200), (1200, 2000)]
+        tile_lines = [
+            [(1150, 1190, "111111 1 11111111 100")],
+            [(1210, 1250, "222222 1 22222222 200")],
+        ]
+        self.assertEqual(_stitch(tile_lines, tiles).split("\n"), [
+            "111111 1 11111111 100",
+            "222222 1 22222222 200",
+        ])
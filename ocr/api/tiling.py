@@ -0,0 +1,155 @@
+import os
+import statistics
+from concurrent.futures import ThreadPoolExecutor
+
+import pytesseract
+from PIL import Image
+
+# Local full-document OCR for large delivery-note scans.
+#
+# The page is split into horizontal tiles, cutting in whitespace gaps between
+# text lines where possible. When no gap is found the tile is cut hard and the
+# next one overlaps it by `overlap` pixels. Each tile is recognised by its own
+# tesseract process, so tiles run in parallel across cores while the worker
+# only holds one tile per thread.
+#
+# Tiles are stitched by line position rather than text: every recognised line
+# belongs to the tile whose share of the page contains its vertical centre,
+# the split being the middle of the overlap band. A line cut in half by the
+# hard cut is centred on the far side of that split in the tile holding the
+# partial copy, so only the complete copy is kept, as long as text lines are
+# shorter than the overlap. With an overlap of 0 a line crossing a hard cut
+# is kept as two partial lines. A line centred within SPLIT_TOLERANCE of the
+# split is also compared by text, since the two tiles can box it slightly
+# differently. Two different lines there with identical text are kept once.
+#
+# tesseract also runs its own OpenMP threads, which oversubscribes the cores
+# when tiles run in parallel. Set OMP_THREAD_LIMIT=1 in the worker environment
+# when using local OCR on multi-core hosts.
+
+DEFAULT_TILE_HEIGHT = 1200
+DEFAULT_OVERLAP = 100
+# Extra mean ink per row (0-255) over the quietest row in the search window
+# that still counts as whitespace, to tolerate scan noise
+BLANK_ROW_MARGIN = 2
+DOCUMENT_CONFIG = r'--oem 3 --psm 6'
+# Pixels around a tile split within which a line is also de-duplicated by text
+SPLIT_TOLERANCE = 3
+
+
+def _row_ink(img):
+    # Mean amount of ink in every pixel row, computed in C by PIL
+    ink = img.point(lambda p: 255 if p < 128 else 0)
+    column = ink.resize((1, img.height), Image.Resampling.BOX)
+    return list(column.tobytes())
+
+
+def _find_gap(ink, start, end):
+    # Lowest whitespace row in ink[start:end + 1], or None
+    window = ink[start:end + 1]
+    # Table borders, vertical rules and noise add a constant amount of ink to
+    # every row, so blank rows are measured against the window's own floor
+    floor = min(window)
+    if floor > statistics.median(window) / 2:
+        # No row is clearly emptier than the text around it
+        return None
+    for y in range(end, start - 1, -1):
+        if ink[y] <= floor + BLANK_ROW_MARGIN:
+            return y
+    return None
+
+
+def find_tiles(img, tile_height=DEFAULT_TILE_HEIGHT, overlap=DEFAULT_OVERLAP):
+    # Returns [(top, bottom)] covering the whole image
+    if tile_height < 1 or not 0 <= overlap < tile_height:
+        raise ValueError(f"Invalid tiling: tile_height={tile_height}, overlap={overlap}")
+
+    height = img.height
+    if height <= tile_height:
+        return [(0, height)]
+
+    ink = _row_ink(img)
+    tiles = []
+    top = 0
+    while top + tile_height < height:
+        window_end = top + tile_height
+        # Cut at the lowest blank row in the bottom half of the tile
+        cut = _find_gap(ink, top + tile_height // 2 + 1, window_end)
+        if cut is not None:
+            tiles.append((top, cut))
+            top = cut
+        else:
+            tiles.append((top, window_end))
+            top = window_end - overlap
+
+    tiles.append((top, height))
+    return tiles
+
+
+def _recognize_tile(img, box):
+    # Returns [(line top, line bottom, text)] in page coordinates
+    tile = img.crop((0, box[0], img.width, box[1]))
+    try:
+        data = pytesseract.image_to_data(tile, config=DOCUMENT_CONFIG, output_type=pytesseract.Output.DICT)
+    finally:
+        tile.close()
+
+    lines = {}
+    for i, word in enumerate(data['text']):
+        if not word.strip():
+            continue
+        key = (data['block_num'][i], data['par_num'][i], data['line_num'][i])
+        top = box[0] + data['top'][i]
+        bottom = top + data['height'][i]
+        line = lines.setdefault(key, [top, bottom, []])
+        line[0] = min(line[0], top)
+        line[1] = max(line[1], bottom)
+        line[2].append(word.strip())
+
+    return [(top, bottom, ' '.join(words)) for top, bottom, words in lines.values()]
+
+
+def _stitch(tile_lines, tiles):
+    text = []
+    previous = []
+    for i, (lines, (top, bottom)) in enumerate(zip(tile_lines, tiles)):
+        # Split overlapping tiles in the middle of the band they share
+        keep_top = (top + tiles[i - 1][1]) / 2 if i else top
+        keep_bottom = (bottom + tiles[i + 1][0]) / 2 if i + 1 < len(tiles) else bottom
+
+        # Each tile is thresholded on its own, so the same line can get slightly
+        # different boxes and land on both sides of the split. Lines this close
+        # to the split are also compared by text with the previous tile's.
+        near_split = {
+            " ".join(line.split()) for line_top, line_bottom, line in previous
+            if abs((line_top + line_bottom) / 2 - keep_top) <= SPLIT_TOLERANCE
+        }
+        kept = []
+        for line_top, line_bottom, line in lines:
+            centre = (line_top + line_bottom) / 2
+            if not keep_top <= centre < keep_bottom:
+                continue
+            if abs(centre - keep_top) <= SPLIT_TOLERANCE and " ".join(line.split()) in near_split:
+                continue
+            kept.append((line_top, line_bottom, line))
+
+        text.extend(line for _, _, line in kept)
+        previous = kept
+    return '\n'.join(text)
+
+
+def ocr_document(file_path, tile_height=DEFAULT_TILE_HEIGHT, overlap=DEFAULT_OVERLAP, max_workers=None):
+    with Image.open(file_path) as img:
+        img = img.convert("L")
+
+    tiles = find_tiles(img, tile_height, overlap)
+    if len(tiles) == 1:
+        return pytesseract.image_to_string(img, config=DOCUMENT_CONFIG)
+
+    max_workers = max_workers or min(len(tiles), os.cpu_count() or 1)
+
+    # tesseract runs as a subprocess, so threads are enough to use every core
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        tile_lines = list(executor.map(lambda box: _recognize_tile(img, box), tiles))
+
+    return _stitch(tile_lines, tiles)